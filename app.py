@@ -23,11 +23,12 @@ Demais comportamentos de UI e lógica permanecem iguais:
   * 'valor' com 2 casas, formato '#,##0.00' (sem "R$"), coluna 'valor' largura 14.
 """
 
-import os, re, sys, platform
+import os, re, sys, platform, subprocess, threading, functools, tempfile, datetime, hashlib
 from typing import Optional, Any, List, Dict
 
 # -------- Lógica: dependências --------
 try:
+    import numpy as np
     import pandas as pd
 except ModuleNotFoundError:
     import tkinter as _tk
@@ -40,6 +41,8 @@ except ModuleNotFoundError:
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter import font as tkfont
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Alignment
 
@@ -53,14 +56,25 @@ def col_to_index(col: str) -> int:
         idx = idx * 26 + (ord(ch) - ord('A') + 1)
     return idx - 1
 
+# Colunas conhecidas (evita refazer col_to_index a cada célula)
+_COL_IDX = {"A": 0, "B": 1, "C": 2, "J": 9, "L": 11, "O": 14, "Q": 16, "T": 19}
+
 def get_cell(df: pd.DataFrame, col_letter: str, row_number: int) -> Any:
     r = row_number - 1
-    c = col_to_index(col_letter)
+    c = _COL_IDX.get(col_letter)
+    if c is None:
+        c = col_to_index(col_letter)
     try:
-        return df.iat[r, c]
+        # rótulo = índice original da coluna (header=None), vale também
+        # para os frames lidos só com USECOLS
+        return df.at[r, c]
     except Exception:
         return None
 
+# Limpeza de números BR: remove "R$", espaços, "%" e separador de milhar
+_NUM_TRANS = str.maketrans("", "", "R$r \xa0%.")
+_NUM_RE = re.compile(r"[^0-9.\-]")
+
 def parse_br_number(v: Any) -> Optional[float]:
     if v is None:
         return None
@@ -72,9 +86,8 @@ def parse_br_number(v: Any) -> Optional[float]:
     s = str(v).strip()
     if s == "" or s.lower() in {"nan", "none"}:
         return None
-    s = s.replace("R$", "").replace("r$", "").replace(" ", "").replace("\xa0", "")
-    s = s.replace("%", "").replace(".", "").replace(",", ".")
-    s = re.sub(r"[^0-9\.\-]", "", s)
+    s = s.translate(_NUM_TRANS).replace(",", ".")
+    s = _NUM_RE.sub("", s)
     try:
         return float(s)
     except Exception:
@@ -83,31 +96,87 @@ def parse_br_number(v: Any) -> Optional[float]:
 def not_blank(x: Any) -> bool:
     return x is not None and str(x).strip() != ""
 
+def round_amount(f: float) -> Optional[float]:
+    val = round(abs(float(f)), 2)
+    return val if val > 0 else None
+
+# Referência escalar das regras de valor (parse_br_number + round_amount):
+# a extração usa parse_br_column, que deve dar o mesmo resultado célula a
+# célula; to_amount fica para conferir parse_br_column contra ela.
 def to_amount(v: Any) -> Optional[float]:
     f = parse_br_number(v)
     if f is None:
         return None
-    val = round(abs(float(f)), 2)
-    return val if val > 0 else None
-
-def append_rows_for(df: pd.DataFrame, out: List[Dict[str, Any]], rownum: int):
-    a = get_cell(df, "A", rownum)
-    b = get_cell(df, "B", rownum)
-    mes_ano = get_cell(df, "C", 5)
-    seq = get_cell(df, "C", 6)
-    just = get_cell(df, "C", 9)
-    doc = get_cell(df, "C", 10)
-
-    vals = {
-        "J": to_amount(get_cell(df, "J", rownum)),  # rubrica fixa "00001"
-        "O": to_amount(get_cell(df, "O", rownum)),  # rubrica vem de L
-        "T": to_amount(get_cell(df, "T", rownum)),  # rubrica vem de Q
-    }
-
-    has_amount = any(v is not None for v in vals.values())
-    has_identity = not_blank(a) or not_blank(b)
-    if not (has_amount and has_identity):
-        return
+    return round_amount(f)
+
+# Tipos que parse_br_number trata como número (os demais passam por str)
+_NUM_TYPES = [int, float, bool, np.float64]
+
+def parse_br_column(series: pd.Series) -> pd.Series:
+    """Versão vetorizada de parse_br_number: float64, NaN para inválidos."""
+    s = pd.Series(series, dtype=object)
+    out = pd.Series(np.nan, index=s.index, dtype="float64")
+    # Classifica pelo tipo exato (map com o builtin type, sem lambda por célula)
+    is_num = s.map(type).isin(_NUM_TYPES)
+    if is_num.any():
+        out[is_num] = s[is_num].astype("float64")
+    txt = s[~is_num & s.notna()]
+    if not txt.empty:
+        txt = (txt.astype(str)
+                  .str.replace(".", "", regex=False)
+                  .str.replace(",", ".", regex=False)
+                  .str.replace(_NUM_RE, "", regex=True))
+        out[txt.index] = pd.to_numeric(txt, errors="coerce")
+    return out
+
+# Colunas lidas do .ods: A, B, C, J, L, O, Q, T (índices base 0)
+USECOLS = [0, 1, 2, 9, 11, 14, 16, 19]
+# Posição de cada coluna na matriz reduzida (sheet_grid)
+IDX_A, IDX_B = 0, 1
+IDX_J, IDX_L, IDX_O, IDX_Q, IDX_T = 3, 4, 5, 6, 7
+# Faixas de linhas (base 1, inclusivas)
+FAIXA_UFGD = (13, 63)
+FAIXA_HU = (71, 121)
+
+def sheet_grid(df: pd.DataFrame) -> np.ndarray:
+    """Matriz object com as colunas USECOLS, completada com None até a linha 121
+    (célula inexistente = None)."""
+    grid = np.full((max(len(df), FAIXA_HU[1]), len(USECOLS)), None, dtype=object)
+    for pos, col in enumerate(USECOLS):
+        if col in df.columns:
+            grid[:len(df), pos] = df[col].to_numpy(dtype=object)
+    return grid
+
+def header_values(df: pd.DataFrame) -> tuple:
+    """C5 (MES/ANO), C6 (sequência), C9 (justificativa), C10 (documento legal)."""
+    return (get_cell(df, "C", 5), get_cell(df, "C", 6),
+            get_cell(df, "C", 9), get_cell(df, "C", 10))
+
+def rubrica_acima(grid: np.ndarray, col_idx: int, rownum: int) -> Any:
+    """Valor da coluna na linha; se vazio, busca para cima na mesma coluna."""
+    rr = rownum - 1
+    rubrica = grid[rr, col_idx]
+    while rr >= 1 and not not_blank(rubrica):
+        rr -= 1
+        rubrica = grid[rr, col_idx]
+    return rubrica
+
+COLS = ["A13", "B13", "MES/ANO", "rubrica", "rendimento",
+        "sequência", "valor", "justificativa", "documento legal"]
+
+def new_columns() -> Dict[str, List[Any]]:
+    """Tabela em colunas (dict de listas), montada direto no DataFrame."""
+    return {c: [] for c in COLS}
+
+def columns_frame(cols: Dict[str, List[Any]]) -> pd.DataFrame:
+    # Vazia: mantém colunas object (listas vazias virariam float64)
+    if not cols["valor"]:
+        return pd.DataFrame(columns=COLS)
+    return pd.DataFrame(cols, columns=COLS)
+
+def append_rows_for(grid: np.ndarray, out: Dict[str, List[Any]], rownum: int,
+                    a: Any, b: Any, vals: Dict[str, Optional[float]], headers: tuple):
+    mes_ano, seq, just, doc = headers
 
     for col, num in vals.items():
         if num is None:
@@ -115,126 +184,172 @@ def append_rows_for(df: pd.DataFrame, out: List[Dict[str, Any]], rownum: int):
 
         if col == "J":
             rubrica = "00001"
-
         elif col == "O":
-            rubrica = get_cell(df, "L", rownum)
-            if not not_blank(rubrica):
-                rr = rownum - 1
-                while rr >= 1 and not not_blank(rubrica):
-                    rubrica = get_cell(df, "L", rr)
-                    rr -= 1
-
+            rubrica = rubrica_acima(grid, IDX_L, rownum)
         elif col == "T":
-            rubrica = get_cell(df, "Q", rownum)
-            if not not_blank(rubrica):
-                rr = rownum - 1
-                while rr >= 1 and not not_blank(rubrica):
-                    rubrica = get_cell(df, "Q", rr)
-                    rr -= 1
-
+            rubrica = rubrica_acima(grid, IDX_Q, rownum)
         else:
             rubrica = "00001"
 
-        out.append({
-            "A13": a,
-            "B13": b,
-            "MES/ANO": mes_ano,
-            "rubrica": rubrica,
-            "rendimento": "r",
-            "sequência": seq,
-            "valor": num,
-            "justificativa": just,
-            "documento legal": doc,
-        })
-
-def process_sheet(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    linhas: List[Dict[str, Any]] = []
-    for r in list(range(13, 64)) + list(range(71, 122)):
-        append_rows_for(df, linhas, r)
+        out["A13"].append(a)
+        out["B13"].append(b)
+        out["MES/ANO"].append(mes_ano)
+        out["rubrica"].append(rubrica)
+        out["rendimento"].append("r")
+        out["sequência"].append(seq)
+        out["valor"].append(num)
+        out["justificativa"].append(just)
+        out["documento legal"].append(doc)
+
+def amount_columns(grid: np.ndarray) -> tuple:
+    """Colunas J, O, T convertidas de uma vez (abs, NaN quando inválido)."""
+    return tuple(
+        parse_br_column(pd.Series(grid[:, c])).abs().to_numpy(dtype="float64")
+        for c in (IDX_J, IDX_O, IDX_T)
+    )
+
+def _filter_amounts(j: np.ndarray, o: np.ndarray, t: np.ndarray):
+    # Pré-filtro: NaN e zero caem fora; o arredondamento exato fica para round_amount
+    j_ok = j > 0
+    o_ok = o > 0
+    t_ok = t > 0
+    return j_ok | o_ok | t_ok, j_ok, o_ok, t_ok
+
+def process_range(grid: np.ndarray, amounts: tuple, faixa: tuple,
+                  headers: tuple) -> Dict[str, List[Any]]:
+    linhas = new_columns()
+    primeira, ultima = faixa
+    j, o, t = (col[primeira - 1:ultima] for col in amounts)
+    mask_any, j_ok, o_ok, t_ok = _filter_amounts(j, o, t)
+    for off in np.flatnonzero(mask_any):
+        rownum = primeira + int(off)
+        a = grid[rownum - 1, IDX_A]
+        b = grid[rownum - 1, IDX_B]
+        if not (not_blank(a) or not_blank(b)):
+            continue
+        vals = {
+            "J": round_amount(j[off]) if j_ok[off] else None,  # rubrica fixa "00001"
+            "O": round_amount(o[off]) if o_ok[off] else None,  # rubrica vem de L
+            "T": round_amount(t[off]) if t_ok[off] else None,  # rubrica vem de Q
+        }
+        if any(v is not None for v in vals.values()):
+            append_rows_for(grid, linhas, rownum, a, b, vals, headers)
     return linhas
 
 def process_sheet_dual(df: pd.DataFrame):
-    linhas_ufgd: List[Dict[str, Any]] = []
-    linhas_hu:   List[Dict[str, Any]] = []
-    for r in range(13, 64):
-        append_rows_for(df, linhas_ufgd, r)
-    for r in range(71, 122):
-        append_rows_for(df, linhas_hu, r)
+    # Atalho: aba curta demais ou sem J/O/T (modelo/vazia) não gera linhas
+    if len(df) < FAIXA_UFGD[0] or not any(
+        USECOLS[i] in df.columns for i in (IDX_J, IDX_O, IDX_T)
+    ):
+        return new_columns(), new_columns()
+    grid = sheet_grid(df)
+    amounts = amount_columns(grid)
+    # Atalho: nenhum valor > 0 em J/O/T nas linhas 13..121
+    if not any((col[FAIXA_UFGD[0] - 1:FAIXA_HU[1]] > 0).any() for col in amounts):
+        return new_columns(), new_columns()
+    # C5/C6/C9/C10 lidos uma vez por aba e repassados a append_rows_for
+    headers = header_values(df)
+    linhas_ufgd = process_range(grid, amounts, FAIXA_UFGD, headers)
+    linhas_hu = process_range(grid, amounts, FAIXA_HU, headers)
     return linhas_ufgd, linhas_hu
 
-def build_tables_and_counts_dual(file_path: str):
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+def read_ods_sheets(file_path: str, engine: str) -> Dict[str, pd.DataFrame]:
+    """Todas as abas do .ods numa única leitura (o arquivo é analisado uma vez só).
+    Para .xlsx, o equivalente mais leve é openpyxl.load_workbook(
+    file_path, read_only=True, data_only=True) iterando ws.iter_rows(values_only=True)."""
     try:
-        xls = pd.ExcelFile(file_path, engine="odf")
+        xls = pd.ExcelFile(file_path, engine=engine)
     except Exception as e:
         raise RuntimeError("Falha ao abrir .ods. Instale: pip install odfpy\n\nDetalhe: " + str(e)) from e
+    with xls:
+        # Só as colunas usadas; callable para não falhar em abas mais estreitas
+        return pd.read_excel(xls, sheet_name=None, header=None,
+                             usecols=lambda c: c in USECOLS)
+
+@functools.lru_cache(maxsize=4)
+def _load_sheets(file_path: str, mtime: float) -> Dict[str, pd.DataFrame]:
+    """Abas do .ods (somente leitura); o mtime na chave invalida o cache
+    quando o arquivo é salvo de novo."""
+    # Leitor calamine (Rust) se instalado; qualquer falha dele (ausente, pandas
+    # antigo, arquivo que ele não lê) cai no odfpy
+    try:
+        return read_ods_sheets(file_path, "calamine")
+    except Exception:
+        return read_ods_sheets(file_path, "odf")
+
+def build_tables_and_counts_dual(file_path: str):
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+    sheets = _load_sheets(os.path.abspath(file_path), os.path.getmtime(file_path))
 
-    all_rows: List[Dict[str, Any]] = []
     details: List[tuple] = []
-    all_ufgd: List[Dict[str, Any]] = []
-    all_hu:   List[Dict[str, Any]] = []
-
-    for name in xls.sheet_names:
-        df = pd.read_excel(file_path, sheet_name=name, header=None, engine="odf")
-        ufgd_rows, hu_rows = process_sheet_dual(df)
-        details.append((name, len(ufgd_rows) + len(hu_rows)))
-        all_rows.extend(ufgd_rows)
-        all_rows.extend(hu_rows)
-        all_ufgd.extend(ufgd_rows)
-        all_hu.extend(hu_rows)
-
-    cols = ["A13", "B13", "MES/ANO", "rubrica", "rendimento",
-            "sequência", "valor", "justificativa", "documento legal"]
-    df_total = pd.DataFrame(all_rows, columns=cols)
-    df_ufgd  = pd.DataFrame(all_ufgd, columns=cols)
-    df_hu    = pd.DataFrame(all_hu, columns=cols)
+    all_rows = new_columns()
+    all_ufgd = new_columns()
+    all_hu = new_columns()
+
+    for name, df in sheets.items():
+        ufgd_cols, hu_cols = process_sheet_dual(df)
+        details.append((name, len(ufgd_cols["valor"]) + len(hu_cols["valor"])))
+        for c in COLS:
+            all_rows[c].extend(ufgd_cols[c])
+            all_rows[c].extend(hu_cols[c])
+            all_ufgd[c].extend(ufgd_cols[c])
+            all_hu[c].extend(hu_cols[c])
+
+    df_total = columns_frame(all_rows)
+    df_ufgd  = columns_frame(all_ufgd)
+    df_hu    = columns_frame(all_hu)
     return df_total, details, df_ufgd, df_hu
 
+# Alinhamento compartilhado (o openpyxl deduplica na tabela de estilos)
+_LEFT = Alignment(horizontal="left")
+
 def salvar_excel_as(df: pd.DataFrame, origem: str, basename: str) -> str:
     """Salva XLSX com nome definido por 'basename' e alinha todas as colunas à esquerda."""
     base = os.path.dirname(os.path.abspath(origem))
     xlsx_out = os.path.join(base, basename)
 
-    with pd.ExcelWriter(xlsx_out, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="resultado")
-        ws = writer.sheets["resultado"]
+    # Modo write_only: células gravadas em fluxo, sem materializar a planilha
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("resultado")
 
-        # Formatação da coluna 'valor' (número, 2 casas)
-        if "valor" in df.columns:
-            cidx = df.columns.get_loc("valor") + 1
-            col_letter = get_column_letter(cidx)
-            for r in range(2, len(df) + 2):
-                cell = ws[f"{col_letter}{r}"]
-                cell.number_format = "#,##0.00"
-                try:
-                    cell.style = "Normal"
-                except Exception:
-                    pass
-            ws.column_dimensions[col_letter].width = 14
-
-        # Ajuste de largura das colunas + alinhamento à esquerda em todas
-        max_row = len(df) + 1
-        max_col = len(df.columns)
-
-        for i, name in enumerate(df.columns, start=1):
-            # largura
-            try:
-                maxlen = max(
-                    (len(str(x)) for x in [name] + df[name].astype(str).tolist()),
-                    default=10
-                )
-            except Exception:
-                maxlen = 15
-            ws.column_dimensions[get_column_letter(i)].width = min(
-                max(10, maxlen + 2), 60
-            )
+    # Ajuste de largura das colunas (precisa vir antes da primeira linha)
+    for i, name in enumerate(df.columns, start=1):
+        try:
+            # comprimento máximo calculado pelo pandas (.str.len), sem laço Python
+            cells_max = df[name].astype("string").str.len().max()
+            maxlen = len(str(name)) if pd.isna(cells_max) else max(len(str(name)), int(cells_max))
+        except Exception:
+            maxlen = 15
+        ws.column_dimensions[get_column_letter(i)].width = min(
+            max(10, maxlen + 2), 60
+        )
 
-        # alinhar todas as colunas à esquerda (cabeçalho + dados)
-        for row in ws.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=max_col):
-            for cell in row:
-                cell.alignment = Alignment(horizontal="left")
+    valor_idx = df.columns.get_loc("valor") if "valor" in df.columns else None
+
+    def make_cell(v: Any) -> WriteOnlyCell:
+        if v is not None and pd.isna(v):
+            v = None
+        cell = WriteOnlyCell(ws, value=v)
+        cell.alignment = _LEFT
+        # datas com o mesmo formato que o to_excel do pandas usava
+        if isinstance(v, datetime.datetime):
+            cell.number_format = "YYYY-MM-DD HH:MM:SS"
+        elif isinstance(v, datetime.date):
+            cell.number_format = "YYYY-MM-DD"
+        return cell
+
+    # alinhar todas as colunas à esquerda (cabeçalho + dados)
+    ws.append([make_cell(name) for name in df.columns])
+    # tuplas direto dos dados (sem montar uma Series por linha como iterrows)
+    for row in df.itertuples(index=False, name=None):
+        cells = [make_cell(v) for v in row]
+        # Formatação da coluna 'valor' (número, 2 casas)
+        if valor_idx is not None:
+            cells[valor_idx].number_format = "#,##0.00"
+        ws.append(cells)
 
+    wb.save(xlsx_out)
     return xlsx_out
 
 def abrir_pasta(path: str):
@@ -242,12 +357,28 @@ def abrir_pasta(path: str):
         if platform.system() == "Windows":
             os.startfile(path)  # type: ignore[attr-defined]
         elif platform.system() == "Darwin":
-            import subprocess; subprocess.Popen(["open", path])
+            subprocess.Popen(["open", path])
         else:
-            import subprocess; subprocess.Popen(["xdg-open", path])
+            subprocess.Popen(["xdg-open", path])
     except Exception:
         pass
 
+def _save_png_atomic(im: Any, path: str):
+    """Grava o PNG num temporário da mesma pasta e troca com os.replace, para
+    que uma gravação interrompida nunca deixe um cache corrompido."""
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(suffix=".png", dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as fh:
+            im.save(fh, format="PNG")
+        os.replace(tmp, path)
+    except Exception:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
 # ================== APP (VISUAL) ==================
 class App(tk.Tk):
     def __init__(self):
@@ -423,13 +554,24 @@ class App(tk.Tk):
             ).grid(row=0, column=0, sticky="e")
             return
         try:
-            from PIL import Image, ImageTk  # type: ignore
-            im = Image.open(p)
-            ratio = target_h / im.height
-            new_w = max(1, int(im.width * ratio))
-            new_h = max(1, int(im.height * ratio))
-            im = im.resize((new_w, new_h), Image.LANCZOS)
-            self.logo_img = ImageTk.PhotoImage(im)
+            # Logo já redimensionado fica em cache no temp
+            # (chave: caminho de origem + mtime + altura)
+            src_hash = hashlib.sha1(os.path.abspath(p).encode("utf-8")).hexdigest()[:10]
+            cache = os.path.join(
+                tempfile.gettempdir(),
+                f"progesp-logo-{src_hash}-{int(os.path.getmtime(p))}-{target_h}.png",
+            )
+            if os.path.exists(cache):
+                self.logo_img = tk.PhotoImage(file=cache)
+            else:
+                from PIL import Image, ImageTk  # type: ignore
+                im = Image.open(p)
+                ratio = target_h / im.height
+                new_w = max(1, int(im.width * ratio))
+                new_h = max(1, int(im.height * ratio))
+                im = im.resize((new_w, new_h), Image.LANCZOS)
+                _save_png_atomic(im, cache)
+                self.logo_img = ImageTk.PhotoImage(im)
         except Exception:
             try:
                 img = tk.PhotoImage(file=p)
@@ -459,34 +601,42 @@ class App(tk.Tk):
         self.btn_browse.configure(style="Primary.TButton")
         self.btn_abrir_pasta.configure(style="Muted.TButton", state="disabled")
         self.lbl_status.config(text=f"Processando '{p}' ...")
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.after(50, self.processar_automatico)
-
-    def processar_automatico(self):
+        # Limpa a tabela numa única chamada Tcl
+        self.tree.delete(*self.tree.get_children())
+        # Processa fora do mainloop para a janela não congelar
+        self.btn_browse.configure(state="disabled")
+        threading.Thread(target=self.processar_automatico, args=(p,), daemon=True).start()
+
+    def processar_automatico(self, ods_path: str):
+        """Roda em thread de fundo; a interface só é tocada via self.after()."""
         try:
-            df_total, details, df_ufgd, df_hu = build_tables_and_counts_dual(self.ods_path)
+            df_total, details, df_ufgd, df_hu = build_tables_and_counts_dual(ods_path)
 
-            xlsx1 = salvar_excel_as(df_ufgd, self.ods_path, "Progressão por Mérito UFGD.xlsx")
-            xlsx2 = salvar_excel_as(df_hu,   self.ods_path, "Progressão por Mérito HU.xlsx")
+            xlsx1 = salvar_excel_as(df_ufgd, ods_path, "Progressão por Mérito UFGD.xlsx")
+            xlsx2 = salvar_excel_as(df_hu,   ods_path, "Progressão por Mérito HU.xlsx")
+        except Exception as e:
+            self.after(0, self._falha_processamento, e)
+            return
+        self.after(0, self._concluir_processamento, ods_path, details, xlsx1, xlsx2)
 
-            arquivo = os.path.basename(self.ods_path)
-            for (sheet_name, count) in details:
-                self.tree.insert("", "end", values=(arquivo, sheet_name, count))
+    def _concluir_processamento(self, ods_path: str, details: List[tuple], xlsx1: str, xlsx2: str):
+        arquivo = os.path.basename(ods_path)
+        for (sheet_name, count) in details:
+            self.tree.insert("", "end", values=(arquivo, sheet_name, count))
 
-            self.lbl_status.config(text=f"Caminho: {xlsx1}  |  {xlsx2}")
+        self.lbl_status.config(text=f"Caminho: {xlsx1}  |  {xlsx2}")
 
-            self.btn_browse.configure(style="Muted.TButton")
-            self.btn_abrir_pasta.configure(style="Primary.TButton", state="normal")
+        self.btn_browse.configure(style="Muted.TButton", state="normal")
+        self.btn_abrir_pasta.configure(style="Primary.TButton", state="normal")
 
-        except Exception as e:
-            messagebox.showerror(
-                "Erro ao processar",
-                f"Ocorreu um erro:\n\n{e}\n\nInstale dependências:\n pip install pandas odfpy openpyxl"
-            )
-            self.lbl_status.config(text=f"Erro: {e}")
-            self.btn_browse.configure(style="Primary.TButton")
-            self.btn_abrir_pasta.configure(style="Muted.TButton", state="disabled")
+    def _falha_processamento(self, e: Exception):
+        messagebox.showerror(
+            "Erro ao processar",
+            f"Ocorreu um erro:\n\n{e}\n\nInstale dependências:\n pip install pandas odfpy openpyxl"
+        )
+        self.lbl_status.config(text=f"Erro: {e}")
+        self.btn_browse.configure(style="Primary.TButton", state="normal")
+        self.btn_abrir_pasta.configure(style="Muted.TButton", state="disabled")
 
     def abrir_saida(self):
         if self.ods_path: